@@ -1,18 +1,48 @@
 import sys
+import os
+import re
+import time
+import asyncio
 import base64
-import mimetypes
-import io
 import datetime
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    # SIMD (AVX2/SSSE3) base64 — 5-10x faster than the stdlib encoder
+    # on the multi-hundred-KB image payloads sent per request.
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    _b64encode = base64.b64encode
+
 from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QLabel, QLineEdit, QTextEdit,
-                             QFileDialog, QMessageBox, QGroupBox, QProgressBar)
-from PyQt6.QtGui import QPixmap
-from PyQt6.QtCore import QThread, pyqtSignal, Qt
-from openai import OpenAI
+                             QFileDialog, QMessageBox, QGroupBox, QProgressBar,
+                             QCheckBox)
+from PyQt6.QtGui import QPixmap, QImage
+from PyQt6.QtCore import (QThread, QTimer, QObject, QRunnable, QThreadPool,
+                          pyqtSignal, Qt)
+import httpx
+from openai import (OpenAI, AsyncOpenAI, APIConnectionError, APITimeoutError,
+                    RateLimitError, InternalServerError)
 from PIL import Image
 
+try:
+    # C JSON serializer — ~10x faster than stdlib json on the large
+    # ASCII data-URL strings in vision request bodies. Optional; the
+    # SDK's own serialization is the fallback.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional: vectorizes GPS DMS→DD conversion for batch imports
+    import numpy as np
+except ImportError:
+    np = None
+
+PREVIEW_DIMENSION = 1024
+
 DEFAULT_PROMPT = (
     "Based on the length and direction of the shadows, "
     "the architectural landmarks, and the known latitude/longitude "
@@ -20,83 +50,481 @@ DEFAULT_PROMPT = (
     "and time of day. Walk me through your reasoning."
 )
 MAX_IMAGE_DIMENSION = 1920
+# In low-detail mode the provider works from a single 512px tile, so
+# anything bigger just gets downsampled server-side.
+LOW_DETAIL_DIMENSION = 512
+
+# Safety cap on concurrent API requests in batch mode
+BATCH_CONCURRENCY = 8
+
+MAX_COMPLETION_TOKENS = 1000
+
+# Report layout, assembled once at import instead of rebuilding the
+# separator runs and header f-strings on every save
+REPORT_SEPARATOR = "=" * 40
+REPORT_DIVIDER = "-" * 40
+REPORT_TEMPLATE = (
+    "Shadow Defective OSINT Report\n"
+    f"{REPORT_SEPARATOR}\n"
+    "Timestamp  : {timestamp}\n"
+    "Image(s)   : {images}\n"
+    "Latitude   : {lat}\n"
+    "Longitude  : {lon}\n"
+    f"{REPORT_SEPARATOR}\n\n"
+    "PROMPT\n"
+    f"{REPORT_DIVIDER}\n"
+    "{prompt}\n\n"
+    "ANALYSIS\n"
+    f"{REPORT_DIVIDER}\n"
+    "{analysis}\n"
+)
 
+# Splits a prompt template into literal and placeholder segments once,
+# so substitution is a single pass and a {lat} inside the lon value
+# can never be re-substituted.
+PROMPT_PLACEHOLDER_RE = re.compile(r"(\{lat\}|\{lon\})")
+
+# Retry policy for transient API failures (timeouts, rate limits,
+# 5xx). Anything else surfaces to the user immediately. The OpenAI
+# clients are built with max_retries=0 so this is the single authority.
+MAX_API_ATTEMPTS = 3
+REQUEST_TIMEOUT = 60
+RETRYABLE_ERRORS = (APITimeoutError, APIConnectionError,
+                    RateLimitError, InternalServerError)
+
+
+def _backoff_delay(attempt):
+    """Exponential backoff: 1 s, 2 s, 4 s, … capped at 16 s."""
+    return min(2 ** attempt, 16)
+
+
+def _is_retryable(exc):
+    if isinstance(exc, RETRYABLE_ERRORS):
+        return True
+    # The orjson fast path goes through httpx directly, so its
+    # transient failures arrive as httpx exceptions instead
+    if isinstance(exc, (httpx.TimeoutException, httpx.TransportError)):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+
+async def _post_chat_fast_async(client, body, timeout):
+    """POST a chat completion with an orjson-serialized body (batch path).
+
+    The SDK serializes request bodies with stdlib json, which walks
+    the ~MB base64 data URL character by character; orjson does the
+    same in one C pass. Reuses the SDK client's pooled httpx transport
+    (private, but stable across openai 1.x) so keep-alive and auth
+    behave exactly like the normal path.
+    """
+    response = await client._client.post(
+        "chat/completions",
+        content=orjson.dumps(body),
+        headers={**client.auth_headers, "Content-Type": "application/json"},
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)["choices"][0]["message"]["content"]
+
+
+def _stream_chat_fast(client, body, timeout, on_delta):
+    """Streaming twin of _post_chat_fast_async for the single-image path.
+
+    Posts the orjson-serialized body with stream=True and walks the SSE
+    lines by hand, calling on_delta for each content token and
+    returning the assembled text.
+    """
+    body = dict(body, stream=True)
+    parts = []
+    with client._client.stream(
+        "POST", "chat/completions",
+        content=orjson.dumps(body),
+        headers={**client.auth_headers, "Content-Type": "application/json"},
+        timeout=timeout,
+    ) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line.startswith("data: "):
+                continue
+            data = line[6:]
+            if data == "[DONE]":
+                break
+            choices = orjson.loads(data).get("choices")
+            if choices:
+                delta = choices[0].get("delta", {}).get("content")
+                if delta:
+                    parts.append(delta)
+                    on_delta(delta)
+    return "".join(parts)
+
+# EXIF tag ids for GPS auto-fill. get_ifd(EXIF_GPS_IFD) returns the GPS
+# IFD directly, keyed by these ids — no need to scan TAGS/GPSTAGS.
+EXIF_GPS_IFD = 0x8825
+GPS_LATITUDE_REF, GPS_LATITUDE = 1, 2
+GPS_LONGITUDE_REF, GPS_LONGITUDE = 3, 4
+
+# EXIF orientation values mapped to the transpose that undoes them,
+# so the cached orientation can be applied without re-parsing EXIF
+# (what ImageOps.exif_transpose would do internally).
+EXIF_ORIENTATION = 0x0112
+_ORIENTATION_TRANSPOSES = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+
+
+def _dms_to_dd(dms, ref):
+    """Convert one EXIF (degrees, minutes, seconds) triple to decimal."""
+    degrees, minutes, seconds = dms
+    dd = float(degrees) + float(minutes) / 60 + float(seconds) / 3600
+    if ref in ("S", "W"):
+        dd = -dd
+    return round(dd, 6)
+
+
+def _dms_to_dd_batch(dms_rows, refs):
+    """Convert many (degrees, minutes, seconds) triples in one pass.
+
+    Vectorized with NumPy when it is available; for directory-sized
+    batches that beats the per-tuple Python loop by well over an order
+    of magnitude. Falls back to the scalar conversion otherwise.
+    """
+    if np is None or not dms_rows:
+        # An empty np.array is 1-D, so the column indexing below would
+        # raise; the list path handles empty input for free.
+        return [_dms_to_dd(dms, ref) for dms, ref in zip(dms_rows, refs)]
+    arr = np.array([[float(v) for v in dms] for dms in dms_rows],
+                   dtype=np.float64)
+    dd = arr[:, 0] + arr[:, 1] / 60.0 + arr[:, 2] / 3600.0
+    dd[np.isin(np.array(refs), ("S", "W"))] *= -1
+    return np.round(dd, 6).tolist()
+
+
+class _Base64StreamWriter:
+    """File-like sink that base64-encodes writes as they arrive.
+
+    img.save() pushes JPEG chunks straight into this, so the encoded
+    image never sits in its own full-size buffer — each write is
+    encoded onto the output bytearray, carrying a <3-byte remainder
+    between writes so block boundaries stay aligned.
+    """
+
+    def __init__(self, out):
+        self._out = out
+        self._carry = b""
+
+    def write(self, data):
+        buf = self._carry + bytes(data)
+        cut = len(buf) - (len(buf) % 3)
+        if cut:
+            self._out += _b64encode(buf[:cut])
+        self._carry = buf[cut:]
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        if self._carry:
+            self._out += _b64encode(self._carry)
+            self._carry = b""
+
+
+def _prepare_payload(image_path, max_dim=MAX_IMAGE_DIMENSION,
+                     orientation=None):
+    """Decode, resize, JPEG-encode and base64 an image into a data URL.
+
+    Module-level (rather than an APIWorker method) so batch mode can
+    ship it to a ProcessPoolExecutor — it must be picklable and must
+    not touch Qt state.
+    """
+    img = Image.open(image_path)
+    # Shrink-on-load: for JPEGs this lets libjpeg decode directly at
+    # 1/2, 1/4 or 1/8 scale instead of decoding 20 MP and throwing
+    # most of it away. No-op for PNG/WebP.
+    img.draft("RGB", (max_dim, max_dim))
+    img.thumbnail((max_dim, max_dim),
+                  Image.Resampling.BILINEAR, reducing_gap=2.0)
+
+    # Always recompress to JPEG: re-encoding PNG/TIFF at this size is
+    # much slower and 3-5x larger, which inflates the base64 payload
+    # sent to the API for no gain in analysis quality.
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+
+    # Undo the camera's EXIF orientation (cheap on the thumbnail) so
+    # the model sees the image the right way up
+    transpose = _ORIENTATION_TRANSPOSES.get(orientation)
+    if transpose is not None:
+        img = img.transpose(transpose)
+
+    # Encode incrementally into the data URL as the JPEG encoder emits
+    # chunks — no intermediate BytesIO holding the whole compressed
+    # image. base64 output is pure ASCII, so decode as such.
+    out = bytearray(b"data:image/jpeg;base64,")
+    sink = _Base64StreamWriter(out)
+    img.save(sink, format="JPEG", quality=85, subsampling=2,
+             optimize=False, progressive=False)
+    sink.close()
+    return out.decode("ascii")
+
+
+class PreviewWorker(QThread):
+    """Decodes a thumbnail-sized preview off the GUI thread.
+
+    QPixmap(path) on the main thread fully decodes the original file
+    (potentially 20 MP) and blocks the UI; here PIL decodes at preview
+    scale via shrink-on-load and hands a small QImage back.
+    """
+    ready = pyqtSignal(str, QImage)
+    failed = pyqtSignal(str)
+
+    def __init__(self, image_path):
+        super().__init__()
+        self.image_path = image_path
 
-class APIWorker(QThread):
-    """A separate thread to handle the OpenAI API request so the main GUI doesn't freeze."""
+    def run(self):
+        try:
+            img = Image.open(self.image_path)
+            orientation = img.getexif().get(EXIF_ORIENTATION)
+            img.draft("RGB", (PREVIEW_DIMENSION, PREVIEW_DIMENSION))
+            img.thumbnail((PREVIEW_DIMENSION, PREVIEW_DIMENSION),
+                          Image.Resampling.BILINEAR, reducing_gap=2.0)
+            if img.mode != "RGB":
+                img = img.convert("RGB")
+            # Same orientation fix-up as the API payload, so portrait
+            # photos don't preview sideways
+            transpose = _ORIENTATION_TRANSPOSES.get(orientation)
+            if transpose is not None:
+                img = img.transpose(transpose)
+            qimage = QImage(img.tobytes(), img.width, img.height,
+                            img.width * 3, QImage.Format.Format_RGB888)
+            # .copy() detaches from the Python buffer before it is freed
+            self.ready.emit(self.image_path, qimage.copy())
+        except Exception:
+            self.failed.emit(self.image_path)  # preview is best-effort
+
+
+class APIWorkerSignals(QObject):
+    """Signal carrier for APIWorker — QRunnable cannot emit directly."""
     finished = pyqtSignal(str)
+    image_finished = pyqtSignal(str, str)
+    chunk = pyqtSignal(str)
     error = pyqtSignal(str)
 
-    def __init__(self, api_key, image_path, lat, lon, prompt_template):
+
+class APIWorker(QRunnable):
+    """Handles OpenAI API requests off the GUI thread so it doesn't freeze.
+
+    A QRunnable scheduled on the shared QThreadPool, so repeated
+    analyses reuse pooled OS threads instead of spawning a QThread per
+    click. Takes a list of (image_path, lat, lon) jobs. A single job is
+    one plain synchronous request; several jobs are dispatched
+    concurrently through AsyncOpenAI under a bounded semaphore, with
+    image prep pushed to an executor so encoding image N+1 overlaps the
+    network wait for image N. Results stream out per image via
+    signals.image_finished.
+    """
+
+    def __init__(self, client, jobs, prompt_template,
+                 payload_cache=None, api_key=None, detail="low",
+                 orientations=None):
         super().__init__()
+        self.signals = APIWorkerSignals()
+        self.client = client
+        # Key for the per-batch AsyncOpenAI client. The async client
+        # must be built inside the batch's event loop — a cached one
+        # would keep pooled connections bound to a closed loop and
+        # fail every request on the next batch.
         self.api_key = api_key
-        self.image_path = image_path
-        self.lat = lat
-        self.lon = lon
+        self.jobs = jobs
         self.prompt_template = prompt_template
+        self._prompt_parts = PROMPT_PLACEHOLDER_RE.split(prompt_template)
+        self.detail = detail
+        self._max_dim = (MAX_IMAGE_DIMENSION if detail == "high"
+                         else LOW_DETAIL_DIMENSION)
+        # Shared with the app so re-running analysis on the same file
+        # skips the whole resize + encode step.
+        self._payload_cache = payload_cache if payload_cache is not None else {}
+        # Orientation tags from the app's one-shot EXIF parse, so the
+        # encode step can fix rotation without re-reading metadata
+        self._orientations = orientations if orientations is not None else {}
 
     def encode_image(self, image_path):
-        """Open, resize if necessary, and base64-encode the image."""
-        img = Image.open(image_path)
-        img.thumbnail((MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION))
-
-        # Preserve format for MIME detection; fall back to JPEG
-        fmt = img.format or "JPEG"
-        buffer = io.BytesIO()
-        # PIL may lose the format attribute after thumbnail(); re-use original ext
-        mime_type, _ = mimetypes.guess_type(image_path)
-        if not mime_type:
-            mime_type = "image/jpeg"
-            fmt = "JPEG"
-
-        # Convert mode if needed (e.g. RGBA → RGB for JPEG)
-        if mime_type == "image/jpeg" and img.mode in ("RGBA", "P"):
-            img = img.convert("RGB")
-
-        img.save(buffer, format=fmt)
-        return base64.b64encode(buffer.getvalue()).decode("utf-8"), mime_type
-
-    def run(self):
-        try:
-            # Only read the key at call time
-            api_key = self.api_key
-            client = OpenAI(api_key=api_key)
-
-            base64_image, mime_type = self.encode_image(self.image_path)
-
-            prompt_text = self.prompt_template.replace("{lat}", self.lat).replace("{lon}", self.lon)
-
-            response = client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
+        """Open, resize if necessary, and return a base64 data URL."""
+        cache_key = (image_path, os.path.getmtime(image_path), self._max_dim)
+        cached = self._payload_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        payload = _prepare_payload(image_path, self._max_dim,
+                                   self._orientations.get(image_path))
+        self._payload_cache[cache_key] = payload
+        return payload
+
+    def _build_prompt(self, lat, lon):
+        subs = {"{lat}": lat, "{lon}": lon}
+        return "".join(subs.get(part, part) for part in self._prompt_parts)
+
+    def _build_messages(self, image_url, lat, lon):
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": self._build_prompt(lat, lon)},
                     {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": prompt_text},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:{mime_type};base64,{base64_image}"
-                                }
-                            }
-                        ]
+                        "type": "image_url",
+                        "image_url": {
+                            "url": image_url,
+                            "detail": self.detail
+                        }
                     }
-                ],
-                max_tokens=1000
-            )
+                ]
+            }
+        ]
+
+    def _build_body(self, image_url, lat, lon):
+        return {
+            "model": "gpt-4o",
+            "messages": self._build_messages(image_url, lat, lon),
+            "max_tokens": MAX_COMPLETION_TOKENS,
+        }
+
+    def _analyze(self, image_path, lat, lon):
+        image_url = self.encode_image(image_path)
+        body = self._build_body(image_url, lat, lon)
+        state = {"emitted": False}
+
+        def on_delta(delta):
+            state["emitted"] = True
+            self.signals.chunk.emit(delta)
+
+        for attempt in range(MAX_API_ATTEMPTS):
+            try:
+                if orjson is not None:
+                    return _stream_chat_fast(self.client, body,
+                                             REQUEST_TIMEOUT, on_delta)
+                stream = self.client.chat.completions.create(
+                    timeout=REQUEST_TIMEOUT, stream=True, **body)
+                parts = []
+                for chunk in stream:
+                    if chunk.choices:
+                        delta = chunk.choices[0].delta.content
+                        if delta:
+                            parts.append(delta)
+                            on_delta(delta)
+                return "".join(parts)
+            except Exception as e:
+                # Never retry once tokens have reached the UI — a rerun
+                # would duplicate output
+                if (state["emitted"] or not _is_retryable(e)
+                        or attempt == MAX_API_ATTEMPTS - 1):
+                    raise
+                time.sleep(_backoff_delay(attempt))
+
+    async def _run_batch(self):
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        loop = asyncio.get_running_loop()
+        async_client = AsyncOpenAI(api_key=self.api_key, max_retries=0)
+
+        # PIL's decode/encode path holds the GIL for long enough that
+        # threads alone don't scale, so fan the CPU-bound image prep
+        # across cores. _prepare_payload is module-level and picklable.
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+
+            async def encode_one(image_path):
+                cache_key = (image_path, os.path.getmtime(image_path),
+                             self._max_dim)
+                cached = self._payload_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+                payload = await loop.run_in_executor(
+                    pool, _prepare_payload, image_path, self._max_dim,
+                    self._orientations.get(image_path))
+                self._payload_cache[cache_key] = payload
+                return payload
+
+            async def analyze_one(image_path, lat, lon):
+                async with semaphore:
+                    # Prep runs off the event loop so it overlaps with
+                    # other images' network waits
+                    image_url = await encode_one(image_path)
+                    body = self._build_body(image_url, lat, lon)
+                    for attempt in range(MAX_API_ATTEMPTS):
+                        try:
+                            if orjson is not None:
+                                return await _post_chat_fast_async(
+                                    async_client, body, REQUEST_TIMEOUT)
+                            response = await async_client.chat.completions.create(
+                                timeout=REQUEST_TIMEOUT, **body)
+                            return response.choices[0].message.content
+                        except Exception as e:
+                            if not _is_retryable(e) or attempt == MAX_API_ATTEMPTS - 1:
+                                raise
+                            await asyncio.sleep(_backoff_delay(attempt))
+
+            async def run_one(job):
+                image_path, lat, lon = job
+                try:
+                    result = await analyze_one(image_path, lat, lon)
+                except Exception as e:
+                    result = f"[error] {e}"
+                self.signals.image_finished.emit(image_path, result)
+
+            try:
+                await asyncio.gather(*(run_one(job) for job in self.jobs))
+            finally:
+                await async_client.close()
 
-            result_text = response.choices[0].message.content
-            self.finished.emit(result_text)
+    def run(self):
+        try:
+            if len(self.jobs) == 1:
+                image_path, lat, lon = self.jobs[0]
+                result_text = self._analyze(image_path, lat, lon)
+                self.signals.image_finished.emit(image_path, result_text)
+                self.signals.finished.emit(result_text)
+            else:
+                asyncio.run(self._run_batch())
+                self.signals.finished.emit("")
 
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
 class ShadowDetectiveApp(QWidget):
     def __init__(self):
         super().__init__()
         self.image_path = None
+        self.image_paths = []
         self.worker = None
+        self._chunk_count = 0
+        self._preview_worker = None
+        self._source_pixmap = None
+        # Debounces the smooth preview rescale during window drags
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(80)
+        self._resize_timer.timeout.connect(self._refresh_image_preview)
+        # Per-path caches so a photo's EXIF is parsed once and the
+        # encoded API payload survives repeated "Run Analysis" clicks.
+        self._image_cache = {}
+        self._payload_cache = {}
+        self._gps_by_path = {}
+        # One pooled OpenAI client per API key: keep-alive connections
+        # amortize the TLS handshake across repeated analyses.
+        self._openai_client = None
+        self._openai_client_key = None
+        # Shared thread pool: analysis runnables reuse OS threads
+        # instead of spawning a QThread per click
+        self._pool = QThreadPool.globalInstance()
         self.initUI()
 
     def initUI(self):
@@ -162,6 +590,10 @@ class ShadowDetectiveApp(QWidget):
         main_layout.addWidget(prompt_group)
 
         # --- Analysis / Progress ---
+        self.detail_checkbox = QCheckBox(
+            "High detail (tiles the full image — slower, more tokens)")
+        main_layout.addWidget(self.detail_checkbox)
+
         self.btn_analyze = QPushButton("Run Shadow Analysis")
         self.btn_analyze.setStyleSheet(
             "background-color: #2E86C1; color: white; font-weight: bold; padding: 10px;"
@@ -197,68 +629,139 @@ class ShadowDetectiveApp(QWidget):
     # ------------------------------------------------------------------
 
     def select_image(self):
-        file_name, _ = QFileDialog.getOpenFileName(
-            self, "Open Image File", "",
+        file_names, _ = QFileDialog.getOpenFileNames(
+            self, "Open Image Files", "",
             "Images (*.png *.jpg *.jpeg *.bmp *.tiff *.webp)"
         )
-        if file_name:
-            self.image_path = file_name
-            self._refresh_image_preview()
+        if file_names:
+            self.image_paths = file_names
+            self.image_path = file_names[0]
+            self._load_image_metadata(self.image_path)
+
+            # Decode the preview (of the first image) off the GUI thread
+            self._source_pixmap = None
+            if len(file_names) > 1:
+                self.image_label.setText(
+                    f"{len(file_names)} images selected — loading preview…")
+            else:
+                self.image_label.setText("Loading preview…")
+            self._preview_worker = PreviewWorker(self.image_path)
+            self._preview_worker.ready.connect(self._on_preview_ready)
+            self._preview_worker.failed.connect(self._on_preview_failed)
+            self._preview_worker.finished.connect(self._preview_worker.deleteLater)
+            self._preview_worker.start()
+
+            # Attempt to auto-populate GPS coords from EXIF; batches
+            # additionally get per-image coordinates in one pass
+            self._try_populate_gps(self.image_path)
+            self._gps_by_path = (self._collect_gps_batch(file_names)
+                                 if len(file_names) > 1 else {})
+
+    def _on_preview_ready(self, image_path, qimage):
+        if image_path != self.image_path:
+            return  # stale result from a superseded selection
+        self._source_pixmap = QPixmap.fromImage(qimage)
+        self._refresh_image_preview()
 
-            # Attempt to auto-populate GPS coords from EXIF
-            self._try_populate_gps(file_name)
+    def _on_preview_failed(self, image_path):
+        if image_path != self.image_path:
+            return
+        self.image_label.setText("Preview unavailable.")
 
     def _refresh_image_preview(self):
-        if not self.image_path:
+        self._scale_preview(Qt.TransformationMode.SmoothTransformation)
+
+    def _scale_preview(self, mode):
+        if self._source_pixmap is None:
             return
-        pixmap = QPixmap(self.image_path)
         self.image_label.setPixmap(
-            pixmap.scaled(
+            self._source_pixmap.scaled(
                 self.image_label.width(), self.image_label.height(),
                 Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
+                mode
             )
         )
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self._refresh_image_preview()
+        # Cheap nearest-neighbour rescale while the drag is in flight;
+        # the debounce timer does one smooth pass once it settles.
+        self._scale_preview(Qt.TransformationMode.FastTransformation)
+        self._resize_timer.start()
+
+    def _load_image_metadata(self, image_path):
+        """Parse EXIF and format once per file and cache the result."""
+        cache_key = (image_path, os.path.getmtime(image_path))
+        if cache_key in self._image_cache:
+            return self._image_cache[cache_key]
+
+        exif = None
+        fmt = None
+        try:
+            with Image.open(image_path) as img:
+                fmt = img.format
+                exif = img.getexif()
+        except Exception:
+            pass  # metadata is best-effort; analysis can proceed without it
+
+        entry = {
+            "exif": exif,
+            "format": fmt,
+            "orientation": exif.get(EXIF_ORIENTATION) if exif else None,
+        }
+        self._image_cache[cache_key] = entry
+        return entry
 
     def _try_populate_gps(self, image_path):
-        """Auto-populate lat/lon from image EXIF if available."""
+        """Auto-populate lat/lon from cached image EXIF if available."""
         try:
-            from PIL.ExifTags import TAGS, GPSTAGS
-            img = Image.open(image_path)
-            exif_data = img._getexif()
-            if not exif_data:
+            exif = self._load_image_metadata(image_path)["exif"]
+            if not exif:
                 return
 
-            gps_info = {}
-            for tag_id, value in exif_data.items():
-                tag = TAGS.get(tag_id, tag_id)
-                if tag == "GPSInfo":
-                    for gps_tag_id, gps_val in value.items():
-                        gps_tag = GPSTAGS.get(gps_tag_id, gps_tag_id)
-                        gps_info[gps_tag] = gps_val
-
+            gps_info = exif.get_ifd(EXIF_GPS_IFD)
             if not gps_info:
                 return
 
-            def dms_to_dd(dms, ref):
-                degrees, minutes, seconds = dms
-                dd = float(degrees) + float(minutes) / 60 + float(seconds) / 3600
-                if ref in ("S", "W"):
-                    dd = -dd
-                return round(dd, 6)
-
-            lat = dms_to_dd(gps_info["GPSLatitude"], gps_info.get("GPSLatitudeRef", "N"))
-            lon = dms_to_dd(gps_info["GPSLongitude"], gps_info.get("GPSLongitudeRef", "E"))
+            lat = _dms_to_dd(gps_info[GPS_LATITUDE], gps_info.get(GPS_LATITUDE_REF, "N"))
+            lon = _dms_to_dd(gps_info[GPS_LONGITUDE], gps_info.get(GPS_LONGITUDE_REF, "E"))
             self.lat_input.setText(str(lat))
             self.lon_input.setText(str(lon))
 
         except Exception:
             pass  # EXIF extraction is best-effort
 
+    def _collect_gps_batch(self, paths):
+        """Extract GPS coords for many images with one vectorized pass.
+
+        Returns {path: (lat, lon)} for the images that carry GPS EXIF;
+        the DMS→DD math for the whole selection goes through
+        _dms_to_dd_batch instead of running tuple-at-a-time.
+        """
+        dms_rows, refs, located = [], [], []
+        for path in paths:
+            try:
+                exif = self._load_image_metadata(path)["exif"]
+                if not exif:
+                    continue
+                gps_info = exif.get_ifd(EXIF_GPS_IFD)
+                # Coerce to plain float triples here so a corrupt GPS
+                # entry (ragged tuple, non-numeric value) drops only
+                # this image instead of blowing up the batch conversion
+                lat_d, lat_m, lat_s = (float(v) for v in gps_info[GPS_LATITUDE])
+                lon_d, lon_m, lon_s = (float(v) for v in gps_info[GPS_LONGITUDE])
+            except Exception:
+                continue  # no usable GPS block in this image
+            dms_rows.append((lat_d, lat_m, lat_s))
+            refs.append(gps_info.get(GPS_LATITUDE_REF, "N"))
+            dms_rows.append((lon_d, lon_m, lon_s))
+            refs.append(gps_info.get(GPS_LONGITUDE_REF, "E"))
+            located.append(path)
+
+        dd = _dms_to_dd_batch(dms_rows, refs)
+        return {path: (dd[2 * i], dd[2 * i + 1])
+                for i, path in enumerate(located)}
+
     # ------------------------------------------------------------------
     # Analysis
     # ------------------------------------------------------------------
@@ -273,7 +776,7 @@ class ShadowDetectiveApp(QWidget):
         if not api_key:
             QMessageBox.warning(self, "Error", "Please enter your OpenAI API key.")
             return
-        if not self.image_path:
+        if not self.image_paths:
             QMessageBox.warning(self, "Error", "Please select an image first.")
             return
         if not lat or not lon:
@@ -285,19 +788,57 @@ class ShadowDetectiveApp(QWidget):
 
         self.btn_analyze.setEnabled(False)
         self.btn_analyze.setText("Analyzing shadows…")
+        self._chunk_count = 0
+        if len(self.image_paths) == 1:
+            # Driven by streamed chunk count (roughly one per token)
+            self.progress_bar.setRange(0, MAX_COMPLETION_TOKENS)
+            self.progress_bar.setValue(0)
+        else:
+            self.progress_bar.setRange(0, 0)   # indeterminate for batches
         self.progress_bar.setVisible(True)
         self.btn_save_report.setEnabled(False)
         self.result_box.clear()
 
-        self.worker = APIWorker(api_key, self.image_path, lat, lon, prompt)
-        self.worker.finished.connect(self.on_analysis_complete)
-        self.worker.error.connect(self.on_analysis_error)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.worker.error.connect(self.worker.deleteLater)
-        self.worker.start()
+        if self._openai_client is None or api_key != self._openai_client_key:
+            self._openai_client = OpenAI(api_key=api_key, max_retries=0)
+            self._openai_client_key = api_key
+
+        detail = "high" if self.detail_checkbox.isChecked() else "low"
+        # Per-image EXIF coordinates win over the shared input fields
+        jobs = []
+        for path in self.image_paths:
+            gps = self._gps_by_path.get(path)
+            if gps is not None:
+                jobs.append((path, str(gps[0]), str(gps[1])))
+            else:
+                jobs.append((path, lat, lon))
+        orientations = {
+            path: self._load_image_metadata(path)["orientation"]
+            for path in self.image_paths
+        }
+        self.worker = APIWorker(self._openai_client, jobs, prompt,
+                                payload_cache=self._payload_cache,
+                                api_key=api_key,
+                                detail=detail, orientations=orientations)
+        self.worker.signals.finished.connect(self.on_analysis_complete)
+        self.worker.signals.chunk.connect(self.on_chunk)
+        self.worker.signals.image_finished.connect(self.on_image_result)
+        self.worker.signals.error.connect(self.on_analysis_error)
+        self._pool.start(self.worker)
+
+    def on_chunk(self, delta):
+        self._chunk_count += 1
+        self.progress_bar.setValue(min(self._chunk_count, MAX_COMPLETION_TOKENS))
+        self.result_box.insertPlainText(delta)
+
+    def on_image_result(self, image_path, result):
+        if len(self.image_paths) > 1:
+            self.result_box.append(f"=== {Path(image_path).name} ===\n{result}\n")
+        else:
+            # Replace the streamed-in text with the canonical result
+            self.result_box.setText(result)
 
-    def on_analysis_complete(self, result):
-        self.result_box.setText(result)
+    def on_analysis_complete(self, _result):
         self.btn_save_report.setEnabled(True)
         self._reset_button()
 
@@ -330,32 +871,25 @@ class ShadowDetectiveApp(QWidget):
             QMessageBox.warning(self, "Nothing to Save", "Run an analysis first.")
             return
 
-        default_name = f"shadow_report_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        now = datetime.datetime.now()
+        default_name = f"shadow_report_{now.strftime('%Y%m%d_%H%M%S')}.txt"
         file_name, _ = QFileDialog.getSaveFileName(
             self, "Save Report", default_name, "Text files (*.txt);;Markdown files (*.md)"
         )
         if not file_name:
             return
 
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        report = (
-            f"Shadow Defective OSINT Report\n"
-            f"{'=' * 40}\n"
-            f"Timestamp  : {timestamp}\n"
-            f"Image      : {self.image_path or 'N/A'}\n"
-            f"Latitude   : {self.lat_input.text().strip()}\n"
-            f"Longitude  : {self.lon_input.text().strip()}\n"
-            f"{'=' * 40}\n\n"
-            f"PROMPT\n"
-            f"{'-' * 40}\n"
-            f"{self.prompt_edit.toPlainText().strip()}\n\n"
-            f"ANALYSIS\n"
-            f"{'-' * 40}\n"
-            f"{result_text}\n"
+        report = REPORT_TEMPLATE.format(
+            timestamp=now.strftime("%Y-%m-%d %H:%M:%S"),
+            images=", ".join(self.image_paths) or "N/A",
+            lat=self.lat_input.text().strip(),
+            lon=self.lon_input.text().strip(),
+            prompt=self.prompt_edit.toPlainText().strip(),
+            analysis=result_text,
         )
 
         try:
-            Path(file_name).write_text(report, encoding="utf-8")
+            Path(file_name).write_bytes(report.encode("utf-8"))
             QMessageBox.information(self, "Saved", f"Report saved to:\n{file_name}")
         except Exception as e:
             QMessageBox.critical(self, "Save Error", f"Could not save report:\n{e}")